@@ -1,9 +1,15 @@
 """BigQuery public API."""
+import concurrent.futures
+import functools
+import operator
+import os
+import time
 import warnings
 from typing import Optional, Tuple
 
 import google.auth.credentials
 import google.cloud.bigquery as bq
+import ibis.expr.datatypes as dt
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 import pydata_google_auth
@@ -24,13 +30,19 @@ from .client import (
 )
 from .compiler import BigQueryCompiler
 
-try:
-    from .udf import udf  # noqa F401
-except ImportError:
-    pass
+__version__: str = ibis_bigquery_version.__version__
 
 
-__version__: str = ibis_bigquery_version.__version__
+def __getattr__(name):
+    # PEP 562: load the UDF machinery on first use instead of paying its
+    # import cost on every `import ibis_bigquery`.
+    if name == "udf":
+        from .udf import udf
+
+        globals()["udf"] = udf
+        return udf
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 SCOPES = ["https://www.googleapis.com/auth/bigquery"]
 EXTERNAL_DATA_SCOPES = [
@@ -41,6 +53,98 @@ EXTERNAL_DATA_SCOPES = [
 CLIENT_ID = "546535678771-gvffde27nd83kfl6qbrnletqvkdmsese.apps.googleusercontent.com"
 CLIENT_SECRET = "iU5ohAF2qcqrujegE3hQ1cPt"
 
+# google-cloud-bigquery >= 3.14 exposes the synchronous jobs.query endpoint,
+# which returns small results inline instead of inserting a job and polling.
+_HAS_QUERY_AND_WAIT = hasattr(bq.Client, "query_and_wait")
+
+# Optional job creation lets BigQuery skip materializing a persistent job
+# (and its temp result table) for short read-only queries.
+_JOB_CREATION_OPTIONAL = getattr(
+    getattr(bq, "JobCreationMode", None), "JOB_CREATION_OPTIONAL", None
+)
+
+# Below this result size the JSON REST path is faster than spinning up a
+# Storage Read API session.
+_BQSTORAGE_MIN_BYTES = 10 * 2 ** 20
+
+_REGEX_METACHARS = frozenset("\\^$.|?*+()[]{}")
+
+
+def _schema_to_dtypes(schema):
+    """Build a column -> pandas dtype map for ``to_dataframe``.
+
+    Only dtypes that survive NULLs without raising are included; the
+    remaining columns are converted by ``Schema.apply_to`` as before.
+    """
+    dtypes = {}
+    for name, ibis_dtype in schema.items():
+        if isinstance(ibis_dtype, dt.Floating) or (
+            isinstance(ibis_dtype, dt.Timestamp) and ibis_dtype.timezone
+        ):
+            dtypes[name] = ibis_dtype.to_pandas()
+    return dtypes
+
+
+def _use_bqstorage(query) -> bool:
+    """Whether `query`'s result is large enough to warrant the Storage API."""
+    nbytes = getattr(query, "total_bytes_processed", None)
+    if nbytes is not None:
+        return nbytes >= _BQSTORAGE_MIN_BYTES
+    return False
+
+
+def _fetch_credentials(
+    scopes: Tuple[str, ...], auth_cache: str, auth_local_webserver: bool
+):
+    """Fetch credentials via ``pydata_google_auth``."""
+    if auth_cache == "default":
+        credentials_cache = cache.ReadWriteCredentialsCache(filename="ibis.json")
+    elif auth_cache == "reauth":
+        credentials_cache = cache.WriteOnlyCredentialsCache(filename="ibis.json")
+    elif auth_cache == "none":
+        credentials_cache = cache.NOOP
+    else:
+        raise ValueError(
+            f"Got unexpected value for auth_cache = '{auth_cache}'. "
+            "Expected one of 'default', 'reauth', or 'none'."
+        )
+
+    return pydata_google_auth.default(
+        list(scopes),
+        client_id=CLIENT_ID,
+        client_secret=CLIENT_SECRET,
+        credentials_cache=credentials_cache,
+        use_local_webserver=auth_local_webserver,
+    )
+
+
+# Reading the token cache from disk and the OAuth exchange only need to
+# happen once per process, but only for auth_cache="default" — "reauth" and
+# "none" are documented to re-authenticate on every connect.
+_get_credentials = functools.lru_cache(maxsize=None)(_fetch_credentials)
+
+
+_client_cache: dict = {}
+
+
+def _get_client(billing_project, credentials, application_name):
+    """Return a ``bq.Client``, reusing one with the same configuration."""
+    key = (billing_project, id(credentials), application_name)
+    client = _client_cache.get(key)
+    if client is None:
+        client = _client_cache[key] = bq.Client(
+            project=billing_project,
+            credentials=credentials,
+            client_info=_create_client_info(application_name),
+        )
+        if _JOB_CREATION_OPTIONAL is not None:
+            # QueryJobConfig has no job_creation_mode property; the client
+            # only sends jobCreationMode from this default, and only on the
+            # jobs.query (query_and_wait) path used for read-only
+            # statements. DDL/DML through client.query is unaffected.
+            client.default_job_creation_mode = _JOB_CREATION_OPTIONAL
+    return client
+
 
 class Backend(BaseSQLBackend):
     name = "bigquery"
@@ -48,6 +152,140 @@ class Backend(BaseSQLBackend):
     database_class = BigQueryDatabase
     table_class = BigQueryTable
 
+    _bqstorage_client = None
+    _table_cache = None
+    _list_cache = None
+    _pd_cache = None
+    _compile_cache = None
+    _compile_cache_size = 256
+    # Table schemas change rarely; a short TTL keeps repeated lookups of the
+    # same table within a query cheap without hiding DDL for long.
+    _metadata_ttl = 60.0  # seconds
+
+    def _cached_get_table(self, table_id):
+        """Fetch table metadata, reusing results fetched recently."""
+        cache = self._table_cache
+        if cache is None:
+            cache = self._table_cache = {}
+        now = time.monotonic()
+        entry = cache.get(table_id)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+        bq_table = self.client.get_table(table_id)
+        cache[table_id] = (bq_table, now + self._metadata_ttl)
+        return bq_table
+
+    def _cached_list(self, key, fetch):
+        """List dataset or table names, reusing results fetched recently."""
+        cache = self._list_cache
+        if cache is None:
+            cache = self._list_cache = {}
+        now = time.monotonic()
+        entry = cache.get(key)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+        names = fetch()
+        cache[key] = (names, now + self._metadata_ttl)
+        return names
+
+    def _compile_cached(self, expr, limit):
+        """Compile `expr` to a query AST and SQL, reusing prior compilations.
+
+        Operation nodes hash structurally, so re-executing an equivalent
+        expression (the common notebook/dashboard pattern) skips the whole
+        compiler pass.
+        """
+        cache = self._compile_cache
+        if cache is None:
+            cache = self._compile_cache = {}
+        key = (expr.op(), limit)
+        entry = cache.get(key)
+        if entry is None:
+            query_ast = self.compiler.to_ast_ensure_limit(expr, limit)
+            sql = query_ast.compile()
+            if len(cache) >= self._compile_cache_size:
+                cache.clear()
+            entry = cache[key] = (query_ast, sql)
+        return entry
+
+    def _get_bqstorage_client(self):
+        """Return a cached BigQuery Storage Read API client, if available."""
+        client = self._bqstorage_client
+        if client is None:
+            try:
+                from google.cloud import bigquery_storage
+            except ImportError:
+                return None
+            client = bigquery_storage.BigQueryReadClient(
+                credentials=self.client._credentials
+            )
+            self._bqstorage_client = client
+        return client
+
+    def _to_arrow_parallel(self, query, bqstorage_client):
+        """Read `query`'s destination table over parallel Arrow streams.
+
+        Returns ``None`` when the result has no destination table to read
+        (e.g. inline jobs.query results), letting the caller fall back to
+        ``to_arrow``.
+        """
+        import pyarrow as pa
+        from google.cloud import bigquery_storage
+
+        destination = getattr(query, "destination", None)
+        if destination is None:
+            return None
+
+        # Streams don't preserve ordering relative to each other, so ordered
+        # results take the order-safe to_arrow fallback, mirroring the
+        # single-stream guard in google-cloud-bigquery's _pandas_helpers.
+        contains_order_by = getattr(bq.job, "_contains_order_by", None)
+        if contains_order_by is None or contains_order_by(query.query):
+            return None
+
+        requested_session = bigquery_storage.types.ReadSession(
+            table=(
+                f"projects/{destination.project}"
+                f"/datasets/{destination.dataset_id}"
+                f"/tables/{destination.table_id}"
+            ),
+            data_format=bigquery_storage.types.DataFormat.ARROW,
+        )
+        session = bqstorage_client.create_read_session(
+            parent=f"projects/{self.billing_project}",
+            read_session=requested_session,
+            max_stream_count=min(os.cpu_count() or 1, 8),
+        )
+        if not session.streams:
+            return None
+
+        def read_stream(stream):
+            return bqstorage_client.read_rows(stream.name).to_arrow(session)
+
+        # Streams decode independently, so reading them concurrently
+        # overlaps network transfer with Arrow decoding.
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=len(session.streams)
+        ) as executor:
+            tables = list(executor.map(read_stream, session.streams))
+        return pa.concat_tables(tables)
+
+    def close(self):
+        """Release the cached Storage Read API client's gRPC channel."""
+        client = self._bqstorage_client
+        if client is not None:
+            self._bqstorage_client = None
+            transport = getattr(client, "transport", None)
+            if transport is not None:
+                transport.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            # Interpreter shutdown may have torn down the transport already.
+            pass
+
     def connect(
         self,
         project_id: Optional[str] = None,
@@ -113,28 +351,11 @@ class Backend(BaseSQLBackend):
             if auth_external_data:
                 scopes = EXTERNAL_DATA_SCOPES
 
-            if auth_cache == "default":
-                credentials_cache = cache.ReadWriteCredentialsCache(
-                    filename="ibis.json"
-                )
-            elif auth_cache == "reauth":
-                credentials_cache = cache.WriteOnlyCredentialsCache(
-                    filename="ibis.json"
-                )
-            elif auth_cache == "none":
-                credentials_cache = cache.NOOP
-            else:
-                raise ValueError(
-                    f"Got unexpected value for auth_cache = '{auth_cache}'. "
-                    "Expected one of 'default', 'reauth', or 'none'."
-                )
-
-            credentials, default_project_id = pydata_google_auth.default(
-                scopes,
-                client_id=CLIENT_ID,
-                client_secret=CLIENT_SECRET,
-                credentials_cache=credentials_cache,
-                use_local_webserver=auth_local_webserver,
+            get_credentials = (
+                _get_credentials if auth_cache == "default" else _fetch_credentials
+            )
+            credentials, default_project_id = get_credentials(
+                tuple(scopes), auth_cache, auth_local_webserver
             )
 
         project_id = project_id or default_project_id
@@ -147,48 +368,60 @@ class Backend(BaseSQLBackend):
             new_backend.dataset,
         ) = parse_project_and_dataset(project_id, dataset_id)
 
-        new_backend.client = bq.Client(
-            project=new_backend.billing_project,
-            credentials=credentials,
-            client_info=_create_client_info(application_name),
+        new_backend.client = _get_client(
+            new_backend.billing_project, credentials, application_name
         )
         new_backend.partition_column = partition_column
 
         return new_backend
 
     def _parse_project_and_dataset(self, dataset) -> Tuple[str, str]:
+        # Memoized per dataset argument; the underlying string parse yields
+        # the same answer until set_database changes the defaults.
+        cache = self._pd_cache
+        if cache is None:
+            cache = self._pd_cache = {}
+        try:
+            return cache[dataset]
+        except KeyError:
+            pass
         if not dataset and not self.dataset:
             raise ValueError("Unable to determine BigQuery dataset.")
-        project, _, dataset = parse_project_and_dataset(
+        project, _, parsed_dataset = parse_project_and_dataset(
             self.billing_project,
-            dataset or "{}.{}".format(self.data_project, self.dataset),
+            dataset or f"{self.data_project}.{self.dataset}",
         )
-        return project, dataset
+        result = cache[dataset] = (project, parsed_dataset)
+        return result
 
-    @property
+    @functools.cached_property
     def project_id(self):
         return self.data_project
 
-    @property
+    @functools.cached_property
     def dataset_id(self):
         return self.dataset
 
     def table(self, name, database=None) -> ir.TableExpr:
-        t = super().table(name, database=database)
+        # One metadata fetch serves both schema inference and partition
+        # column renaming; going through super().table() would trigger a
+        # second get_table for the same table id.
         table_id = self._fully_qualified_name(name, database)
-        bq_table = self.client.get_table(table_id)
+        bq_table = self._cached_get_table(table_id)
+        node = self.table_class(table_id, sch.infer(bq_table), self)
+        t = self.table_expr_class(node)
         return rename_partitioned_column(t, bq_table, self.partition_column)
 
     def _fully_qualified_name(self, name, database):
-        default_project, default_dataset = self._parse_project_and_dataset(database)
-        parts = name.split(".")
-        if len(parts) == 3:
+        num_dots = name.count(".")
+        if num_dots == 2:
             return name
-        elif len(parts) == 2:
-            return "{}.{}".format(default_project, name)
-        elif len(parts) == 1:
-            return "{}.{}.{}".format(default_project, default_dataset, name)
-        raise ValueError("Got too many components in table name: {}".format(name))
+        default_project, default_dataset = self._parse_project_and_dataset(database)
+        if num_dots == 1:
+            return f"{default_project}.{name}"
+        elif num_dots == 0:
+            return f"{default_project}.{default_dataset}.{name}"
+        raise ValueError(f"Got too many components in table name: {name}")
 
     def _get_schema_using_query(self, limited_query):
         with self._execute(limited_query, results=True) as cur:
@@ -202,31 +435,67 @@ class Backend(BaseSQLBackend):
         return self.get_schema(table, database=dataset)
 
     def _adapt_types(self, descr):
-        names = []
-        adapted_types = []
-        for col in descr:
-            names.append(col.name)
-            typename = bigquery_field_to_ibis_dtype(col)
-            adapted_types.append(typename)
+        names = [col.name for col in descr]
+        adapted_types = list(map(bigquery_field_to_ibis_dtype, descr))
         return names, adapted_types
 
-    def _execute(self, stmt, results=True, query_parameters=None):
+    def _execute(
+        self,
+        stmt,
+        results=True,
+        query_parameters=None,
+        max_results=None,
+        wait=True,
+        timeout=None,
+    ):
         job_config = bq.job.QueryJobConfig()
         job_config.query_parameters = query_parameters or []
         job_config.use_legacy_sql = False  # False by default in >=0.28
+
+        if results and _HAS_QUERY_AND_WAIT:
+            # jobs.query returns rows inline, skipping the jobs.insert +
+            # jobs.getQueryResults round-trip of client.query(...).result().
+            rows = self.client.query_and_wait(
+                stmt,
+                job_config=job_config,
+                project=self.billing_project,
+                max_results=max_results,
+                wait_timeout=timeout,
+            )
+            return BigQueryCursor(rows)
+
         query = self.client.query(
             stmt, job_config=job_config, project=self.billing_project
         )
-        query.result()  # blocks until finished
+        if results or wait:
+            query.result(timeout=timeout)  # blocks until finished
         return BigQueryCursor(query)
 
-    def raw_sql(self, query: str, results=False, params=None):
-        query_parameters = [
-            bigquery_param(param, value) for param, value in (params or {}).items()
-        ]
-        return self._execute(query, results=results, query_parameters=query_parameters)
+    def raw_sql(
+        self,
+        query: str,
+        results=False,
+        params=None,
+        max_results=None,
+        wait=True,
+        timeout=None,
+    ):
+        if params:
+            query_parameters = [
+                bigquery_param(param, value) for param, value in params.items()
+            ]
+        else:
+            query_parameters = []
+        return self._execute(
+            query,
+            results=results,
+            query_parameters=query_parameters,
+            max_results=max_results,
+            wait=wait,
+            timeout=timeout,
+        )
 
-    @property
+    @functools.cached_property
     def current_database(self) -> str:
         return self.dataset
 
@@ -264,11 +533,26 @@ class Backend(BaseSQLBackend):
         """
         # TODO: upstream needs to pass params to raw_sql, I think.
         kwargs.pop("timecontext", None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        if params:
+            # Parameters can influence compilation, so only parameter-free
+            # expressions hit the compile cache.
+            query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+            sql = query_ast.compile()
+        else:
+            query_ast, sql = self._compile_cached(expr, limit)
         self._log(sql)
-        cursor = self.raw_sql(sql, params=params, **kwargs)
-        schema = self.ast_schema(query_ast, **kwargs)
+        max_results = limit if isinstance(limit, int) else None
+        cursor = self.raw_sql(
+            sql, results=True, params=params, max_results=max_results, **kwargs
+        )
+        # The finished query already carries its result schema; adapting it
+        # is cheaper than re-walking the expression tree in ast_schema.
+        descr = cursor.description
+        if descr:
+            names, ibis_types = self._adapt_types(descr)
+            schema = sch.Schema(names, ibis_types)
+        else:
+            schema = self.ast_schema(query_ast, **kwargs)
         result = self.fetch_from_cursor(cursor, schema)
 
         if hasattr(getattr(query_ast, "dml", query_ast), "result_handler"):
@@ -322,32 +606,87 @@ class Backend(BaseSQLBackend):
             return True
 
     def fetch_from_cursor(self, cursor, schema):
-        df = cursor.query.to_dataframe()
+        query = cursor.query
+        # The Storage Read API moves large results over a parallel columnar
+        # wire instead of paging them through JSON REST, but costs a session
+        # setup, so small results stay on the REST path.
+        bqstorage_client = (
+            self._get_bqstorage_client() if _use_bqstorage(query) else None
+        )
+        if bqstorage_client is not None:
+            # Stay columnar until the last moment: Arrow batches convert to
+            # pandas blocks without materializing per-row Python objects,
+            # and self_destruct releases each Arrow buffer as its pandas
+            # block is built, roughly halving peak memory.
+            arrow_table = self._to_arrow_parallel(query, bqstorage_client)
+            if arrow_table is None:
+                arrow_table = query.to_arrow(bqstorage_client=bqstorage_client)
+            df = arrow_table.to_pandas(split_blocks=True, self_destruct=True)
+            return schema.apply_to(df)
+        df = query.to_dataframe(
+            bqstorage_client=bqstorage_client,
+            create_bqstorage_client=False,
+            # Columns constructed with their target dtype up front are
+            # no-ops in apply_to's per-column cast pass below.
+            dtypes=_schema_to_dtypes(schema),
+        )
         return schema.apply_to(df)
 
     def get_schema(self, name, database=None):
         table_id = self._fully_qualified_name(name, database)
-        table_ref = bq.TableReference.from_string(table_id)
-        bq_table = self.client.get_table(table_ref)
+        bq_table = self._cached_get_table(table_id)
         return sch.infer(bq_table)
 
     def list_databases(self, like=None):
-        results = [
-            dataset.dataset_id
-            for dataset in self.client.list_datasets(project=self.data_project)
-        ]
-        return self._filter_with_like(results, like)
+        results = self._cached_list(
+            ("datasets", self.data_project),
+            lambda: list(
+                map(
+                    operator.attrgetter("dataset_id"),
+                    self.client.list_datasets(project=self.data_project),
+                )
+            ),
+        )
+        return self._filter_with_like(list(results), like)
 
     def list_tables(self, like=None, database=None):
         project, dataset = self._parse_project_and_dataset(database)
         dataset_ref = bq.DatasetReference(project, dataset)
-        result = [table.table_id for table in self.client.list_tables(dataset_ref)]
-        return self._filter_with_like(result, like)
+        result = self._cached_list(
+            ("tables", project, dataset),
+            lambda: list(
+                map(
+                    operator.attrgetter("table_id"),
+                    self.client.list_tables(dataset_ref),
+                )
+            ),
+        )
+        return self._filter_with_like(list(result), like)
+
+    @staticmethod
+    def _filter_with_like(values, like=None):
+        """Filter names with a `like` pattern (regex).
+
+        Overridden to return unfiltered values directly when there is no
+        pattern and to use substring matching when the pattern contains no
+        regex metacharacters, which is the common case for interactive
+        listing on datasets with many tables.
+        """
+        if like is None:
+            return values
+        if _REGEX_METACHARS.isdisjoint(like):
+            return sorted(value for value in values if like in value)
+        return BaseSQLBackend._filter_with_like(values, like)
 
     def set_database(self, name):
         self.data_project, self.dataset = self._parse_project_and_dataset(name)
+        self._table_cache = None
+        self._list_cache = None
+        self._pd_cache = None
+        for cached in ("project_id", "dataset_id", "current_database"):
+            self.__dict__.pop(cached, None)
 
-    @property
+    @functools.cached_property
     def version(self):
         return bq.__version__
 
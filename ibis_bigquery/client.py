@@ -101,27 +101,43 @@ class BigQueryCursor:
     This allows the BigQuery client to reuse machinery in
     :file:`ibis/client.py`.
 
+    Wraps either a :class:`~google.cloud.bigquery.job.QueryJob` or a
+    :class:`~google.cloud.bigquery.table.RowIterator` returned directly by
+    the ``jobs.query`` fast path.
+
     """
 
     def __init__(self, query):
         """Construct a BigQueryCursor with query `query`."""
         self.query = query
+        self._fetched_rows = None
+
+    def _rows(self):
+        """Return the row iterator for the wrapped query."""
+        result = getattr(self.query, "result", None)
+        if result is not None:
+            return result()
+        return self.query
 
     def fetchall(self):
         """Fetch all rows."""
-        result = self.query.result()
-        return [row.values() for row in result]
+        if self._fetched_rows is None:
+            # Materialize once: unlike QueryJob.result(), which returns a
+            # fresh iterator per call, the fast path wraps a one-shot
+            # RowIterator.
+            self._fetched_rows = [row.values() for row in self._rows()]
+        return list(self._fetched_rows)
 
     @property
     def columns(self):
         """Return the columns of the result set."""
-        result = self.query.result()
+        result = self._rows()
         return [field.name for field in result.schema]
 
     @property
     def description(self):
         """Get the fields of the result set's schema."""
-        result = self.query.result()
+        result = self._rows()
         return list(result.schema)
 
     def __enter__(self):
@@ -193,7 +209,7 @@ def bq_param_array(param, value):
     else:
         if isinstance(param_type.value_type, dt.Struct):
             query_value = [
-                bigquery_param(param[i].name("element_{:d}".format(i)), struct)
+                bigquery_param(param[i].name(f"element_{i:d}"), struct)
                 for i, struct in enumerate(value)
             ]
             bigquery_type = "STRUCT"
@@ -321,9 +337,8 @@ def parse_project_and_dataset(project: str, dataset: str = "") -> Tuple[str, str
     """
     if dataset.count(".") > 1:
         raise ValueError(
-            "{} is not a BigQuery dataset. More info https://cloud.google.com/bigquery/docs/datasets-intro".format(
-                dataset
-            )
+            f"{dataset} is not a BigQuery dataset. More info "
+            "https://cloud.google.com/bigquery/docs/datasets-intro"
         )
     elif dataset.count(".") == 1:
         data_project, dataset = dataset.split(".")
@@ -84,14 +84,14 @@ bigquery_cast = Dispatcher("bigquery_cast")
 @bigquery_cast.register(str, dt.Timestamp, dt.Integer)
 def bigquery_cast_timestamp_to_integer(compiled_arg, from_, to):
     """Convert TIMESTAMP to INT64 (seconds since Unix epoch)."""
-    return "UNIX_MICROS({})".format(compiled_arg)
+    return f"UNIX_MICROS({compiled_arg})"
 
 
 @bigquery_cast.register(str, dt.DataType, dt.DataType)
 def bigquery_cast_generate(compiled_arg, from_, to):
     """Cast to desired type."""
     sql_type = ibis_type_to_bigquery_type(to)
-    return "CAST({} AS {})".format(compiled_arg, sql_type)
+    return f"CAST({compiled_arg} AS {sql_type})"
 
 
 def _cast(translator, expr):
@@ -104,18 +104,18 @@ def _cast(translator, expr):
 def _struct_field(translator, expr):
     arg, field = expr.op().args
     arg_formatted = translator.translate(arg)
-    return "{}.`{}`".format(arg_formatted, field)
+    return f"{arg_formatted}.`{field}`"
 
 
 def _array_concat(translator, expr):
-    return "ARRAY_CONCAT({})".format(
-        ", ".join(map(translator.translate, expr.op().args))
-    )
+    args = ", ".join(map(translator.translate, expr.op().args))
+    return f"ARRAY_CONCAT({args})"
 
 
 def _array_index(translator, expr):
     # SAFE_OFFSET returns NULL if out of bounds
-    return "{}[SAFE_OFFSET({})]".format(*map(translator.translate, expr.op().args))
+    arg, index = map(translator.translate, expr.op().args)
+    return f"{arg}[SAFE_OFFSET({index})]"
 
 
 def _hash(translator, expr):
@@ -138,8 +138,9 @@ def _string_find(translator, expr):
     if end is not None:
         raise NotImplementedError("end not implemented for string find")
 
-    return "STRPOS({}, {}) - 1".format(
-        translator.translate(haystack), translator.translate(needle)
+    return (
+        f"STRPOS({translator.translate(haystack)}, "
+        f"{translator.translate(needle)}) - 1"
     )
 
 
@@ -151,49 +152,46 @@ def _translate_pattern(translator, pattern):
 def _regex_search(translator, expr):
     arg, pattern = expr.op().args
     regex = _translate_pattern(translator, pattern)
-    result = "REGEXP_CONTAINS({}, {})".format(translator.translate(arg), regex)
-    return result
+    return f"REGEXP_CONTAINS({translator.translate(arg)}, {regex})"
 
 
 def _regex_extract(translator, expr):
     arg, pattern, index = expr.op().args
     regex = _translate_pattern(translator, pattern)
-    result = "REGEXP_EXTRACT_ALL({}, {})[SAFE_OFFSET({})]".format(
-        translator.translate(arg), regex, translator.translate(index)
+    return (
+        f"REGEXP_EXTRACT_ALL({translator.translate(arg)}, {regex})"
+        f"[SAFE_OFFSET({translator.translate(index)})]"
     )
-    return result
 
 
 def _regex_replace(translator, expr):
     arg, pattern, replacement = expr.op().args
     regex = _translate_pattern(translator, pattern)
-    result = "REGEXP_REPLACE({}, {}, {})".format(
-        translator.translate(arg), regex, translator.translate(replacement)
+    return (
+        f"REGEXP_REPLACE({translator.translate(arg)}, {regex}, "
+        f"{translator.translate(replacement)})"
     )
-    return result
 
 
 def _string_concat(translator, expr):
-    return "CONCAT({})".format(", ".join(map(translator.translate, expr.op().arg)))
+    args = ", ".join(map(translator.translate, expr.op().arg))
+    return f"CONCAT({args})"
 
 
 def _string_join(translator, expr):
     sep, args = expr.op().args
-    return "ARRAY_TO_STRING([{}], {})".format(
-        ", ".join(map(translator.translate, args)), translator.translate(sep)
-    )
+    joined = ", ".join(map(translator.translate, args))
+    return f"ARRAY_TO_STRING([{joined}], {translator.translate(sep)})"
 
 
 def _string_ascii(translator, expr):
     (arg,) = expr.op().args
-    return "TO_CODE_POINTS({})[SAFE_OFFSET(0)]".format(translator.translate(arg))
+    return f"TO_CODE_POINTS({translator.translate(arg)})[SAFE_OFFSET(0)]"
 
 
 def _string_right(translator, expr):
     arg, nchars = map(translator.translate, expr.op().args)
-    return "SUBSTR({arg}, -LEAST(LENGTH({arg}), {nchars}))".format(
-        arg=arg, nchars=nchars
-    )
+    return f"SUBSTR({arg}, -LEAST(LENGTH({arg}), {nchars}))"
 
 
 def _string_substring(translator, expr):
@@ -216,10 +214,10 @@ def _log(translator, expr):
     arg_formatted = translator.translate(arg)
 
     if base is None:
-        return "ln({})".format(arg_formatted)
+        return f"ln({arg_formatted})"
 
     base_formatted = translator.translate(base)
-    return "log({}, {})".format(arg_formatted, base_formatted)
+    return f"log({arg_formatted}, {base_formatted})"
 
 
 def _literal(translator, expr):
@@ -227,7 +225,7 @@ def _literal(translator, expr):
     if isinstance(expr, ir.NumericValue):
         value = expr.op().value
         if not np.isfinite(value):
-            return "CAST({!r} AS FLOAT64)".format(str(value))
+            return f"CAST({str(value)!r} AS FLOAT64)"
 
     # special case literal timestamp, date, and time scalars
     if isinstance(expr.op(), ops.Literal):
@@ -237,16 +235,15 @@ def _literal(translator, expr):
                 raw_value = value.date()
             else:
                 raw_value = value
-            return "DATE '{}'".format(raw_value)
+            return f"DATE '{raw_value}'"
         elif isinstance(expr, ir.TimestampScalar):
-            return "TIMESTAMP '{}'".format(value)
+            return f"TIMESTAMP '{value}'"
         elif isinstance(expr, ir.TimeScalar):
             # TODO: define extractors on TimeValue expressions
-            return "TIME '{}'".format(value)
+            return f"TIME '{value}'"
         elif isinstance(expr, ir.BinaryScalar):
-            return "FROM_BASE64('{}')".format(
-                base64.b64encode(value).decode(encoding="utf-8")
-            )
+            encoded = base64.b64encode(value).decode(encoding="utf-8")
+            return f"FROM_BASE64('{encoded}')"
 
     try:
         return literal(translator, expr)
@@ -264,10 +261,10 @@ def _arbitrary(translator, expr):
 
     if how not in (None, "first"):
         raise com.UnsupportedOperationError(
-            "{!r} value not supported for arbitrary in BigQuery".format(how)
+            f"{how!r} value not supported for arbitrary in BigQuery"
         )
 
-    return "ANY_VALUE({})".format(translator.translate(arg))
+    return f"ANY_VALUE({translator.translate(arg)})"
 
 
 _date_units = {
@@ -297,10 +294,10 @@ def _truncate(kind, units):
         valid_unit = units.get(unit)
         if valid_unit is None:
             raise com.UnsupportedOperationError(
-                "BigQuery does not support truncating {} values to unit "
-                "{!r}".format(arg.type(), unit)
+                f"BigQuery does not support truncating {arg.type()} "
+                f"values to unit {unit!r}"
             )
-        return "{}_TRUNC({}, {})".format(kind, trans_arg, valid_unit)
+        return f"{kind}_TRUNC({trans_arg}, {valid_unit})"
 
     return truncator
 
@@ -314,12 +311,11 @@ def _timestamp_op(func, units):
         if unit not in units:
             raise com.UnsupportedOperationError(
                 "BigQuery does not allow binary operation "
-                "{} with INTERVAL offset {}".format(func, unit)
+                f"{func} with INTERVAL offset {unit}"
             )
         formatted_arg = translator.translate(arg)
         formatted_offset = translator.translate(offset)
-        result = "{}({}, {})".format(func, formatted_arg, formatted_offset)
-        return result
+        return f"{func}({formatted_arg}, {formatted_offset})"
 
     return _formatter
 
@@ -435,7 +431,7 @@ class BigQueryExprTranslator(ExprTranslator):
         op = expr.op()
         if op not in self.context.params:
             raise KeyError(op)
-        return "@{}".format(expr.get_name())
+        return f"@{expr.get_name()}"
 
 
 compiles = BigQueryExprTranslator.compiles
@@ -447,7 +443,7 @@ def bigquery_day_of_week_index(t, e):
     """Convert timestamp to day-of-week integer."""
     arg = e.op().args[0]
     arg_formatted = t.translate(arg)
-    return "MOD(EXTRACT(DAYOFWEEK FROM {}) + 5, 7)".format(arg_formatted)
+    return f"MOD(EXTRACT(DAYOFWEEK FROM {arg_formatted}) + 5, 7)"
 
 
 @rewrites(ops.DayOfWeekName)
@@ -460,7 +456,8 @@ def bigquery_day_of_week_name(e):
 @compiles(ops.Divide)
 def bigquery_compiles_divide(t, e):
     """Floating point division."""
-    return "IEEE_DIVIDE({}, {})".format(*map(t.translate, e.op().args))
+    left, right = map(t.translate, e.op().args)
+    return f"IEEE_DIVIDE({left}, {right})"
 
 
 @compiles(ops.Strftime)
@@ -472,15 +469,12 @@ def compiles_strftime(translator, expr):
     fmt_string = translator.translate(format_string)
     arg_formatted = translator.translate(arg)
     if isinstance(arg_type, dt.Timestamp):
-        return "FORMAT_{}({}, {}, {!r})".format(
-            strftime_format_func_name,
-            fmt_string,
-            arg_formatted,
-            arg_type.timezone if arg_type.timezone is not None else "UTC",
+        timezone = arg_type.timezone if arg_type.timezone is not None else "UTC"
+        return (
+            f"FORMAT_{strftime_format_func_name}"
+            f"({fmt_string}, {arg_formatted}, {timezone!r})"
         )
-    return "FORMAT_{}({}, {})".format(
-        strftime_format_func_name, fmt_string, arg_formatted
-    )
+    return f"FORMAT_{strftime_format_func_name}({fmt_string}, {arg_formatted})"
 
 
 @compiles(ops.StringToTimestamp)
@@ -491,17 +485,15 @@ def compiles_string_to_timestamp(translator, expr):
     arg_formatted = translator.translate(arg)
     if timezone_arg is not None:
         timezone_str = translator.translate(timezone_arg)
-        return "PARSE_TIMESTAMP({}, {}, {})".format(
-            fmt_string, arg_formatted, timezone_str
-        )
-    return "PARSE_TIMESTAMP({}, {})".format(fmt_string, arg_formatted)
+        return f"PARSE_TIMESTAMP({fmt_string}, {arg_formatted}, {timezone_str})"
+    return f"PARSE_TIMESTAMP({fmt_string}, {arg_formatted})"
 
 
 class BigQueryTableSetFormatter(TableSetFormatter):
     def _quote_identifier(self, name):
         if re.match(r"^[A-Za-z][A-Za-z_0-9]*$", name):
             return name
-        return "`{}`".format(name)
+        return f"`{name}`"
 
 
 class BigQueryCompiler(comp.Compiler):
@@ -560,14 +552,14 @@ UNIT_FUNCS = {"s": "SECONDS", "ms": "MILLIS", "us": "MICROS"}
 @compiles(ops.TimestampFromUNIX)
 def compiles_timestamp_from_unix(t, e):
     value, unit = e.op().args
-    return "TIMESTAMP_{}({})".format(UNIT_FUNCS[unit], t.translate(value))
+    return f"TIMESTAMP_{UNIT_FUNCS[unit]}({t.translate(value)})"
 
 
 @compiles(ops.Floor)
 def compiles_floor(t, e):
     bigquery_type = ibis_type_to_bigquery_type(e.type())
     arg = e.op().arg
-    return "CAST(FLOOR({}) AS {})".format(t.translate(arg), bigquery_type)
+    return f"CAST(FLOOR({t.translate(arg)}) AS {bigquery_type})"
 
 
 @compiles(ops.CMSMedian)
@@ -579,7 +571,7 @@ def compiles_approx(translator, expr):
     if where is not None:
         arg = where.ifelse(arg, ibis.NA)
 
-    return "APPROX_QUANTILES({}, 2)[OFFSET(1)]".format(translator.translate(arg))
+    return f"APPROX_QUANTILES({translator.translate(arg)}, 2)[OFFSET(1)]"
 
 
 @compiles(ops.Covariance)
@@ -594,14 +586,14 @@ def compiles_covar(translator, expr):
     elif expr.how == "pop":
         how = "POP"
     else:
-        raise ValueError("Covariance with how={!r} is not supported.".format(how))
+        raise ValueError(f"Covariance with how={how!r} is not supported.")
 
     if where is not None:
         left = where.ifelse(left, ibis.NA)
         right = where.ifelse(right, ibis.NA)
 
-    return "COVAR_{}({}, {})".format(
-        how, translator.translate(left), translator.translate(right)
+    return (
+        f"COVAR_{how}({translator.translate(left)}, {translator.translate(right)})"
     )
 
 
@@ -615,19 +607,19 @@ def bigquery_any_all_no_op(expr):
 
 @compiles(ops.Any)
 def bigquery_compile_any(translator, expr):
-    return "LOGICAL_OR({})".format(*map(translator.translate, expr.op().args))
+    return f"LOGICAL_OR({translator.translate(expr.op().args[0])})"
 
 
 @compiles(ops.NotAny)
 def bigquery_compile_notany(translator, expr):
-    return "LOGICAL_AND(NOT ({}))".format(*map(translator.translate, expr.op().args))
+    return f"LOGICAL_AND(NOT ({translator.translate(expr.op().args[0])}))"
 
 
 @compiles(ops.All)
 def bigquery_compile_all(translator, expr):
-    return "LOGICAL_AND({})".format(*map(translator.translate, expr.op().args))
+    return f"LOGICAL_AND({translator.translate(expr.op().args[0])})"
 
 
 @compiles(ops.NotAll)
 def bigquery_compile_notall(translator, expr):
-    return "LOGICAL_OR(NOT ({}))".format(*map(translator.translate, expr.op().args))
+    return f"LOGICAL_OR(NOT ({translator.translate(expr.op().args[0])}))"
@@ -11,6 +11,16 @@ import ibis_bigquery
 pytestmark = pytest.mark.bigquery
 
 
+@pytest.fixture(autouse=True)
+def clear_connect_caches():
+    """Credentials and clients are cached across connect() calls."""
+    ibis_bigquery._get_credentials.cache_clear()
+    ibis_bigquery._client_cache.clear()
+    yield
+    ibis_bigquery._get_credentials.cache_clear()
+    ibis_bigquery._client_cache.clear()
+
+
 def test_repeated_project_name(project_id, credentials):
     con = ibis_bigquery.connect(
         project_id=project_id,
@@ -1,6 +1,11 @@
-import ibis  # noqa: F401
+import ibis
+import ibis.expr.datatypes as dt
+import numpy as np
+import pandas as pd
 import pytest
+from ibis.backends.base.sql import BaseSQLBackend
 
+import ibis_bigquery
 import ibis_bigquery.client
 
 
@@ -27,3 +32,70 @@ def test_parse_project_and_dataset_raises_error():
         ibis_bigquery.client.parse_project_and_dataset(
             "my-project", "data-project.my_dataset.table"
         )
+
+
+@pytest.mark.parametrize(
+    "like",
+    [
+        None,
+        "",
+        "functional",
+        "alltypes",
+        "^functional_.*$",
+        "table(s)?",
+        "no_match",
+    ],
+)
+def test_filter_with_like_matches_base_backend(like):
+    values = ["functional_alltypes", "other_table", "functional_tables"]
+    got = ibis_bigquery.Backend._filter_with_like(values, like)
+    expected = BaseSQLBackend._filter_with_like(values, like)
+    assert got == expected
+
+
+@pytest.fixture
+def backend():
+    backend = ibis_bigquery.Backend()
+    backend.billing_project = "billing-project"
+    backend.data_project = "data-project"
+    backend.dataset = "my_dataset"
+    return backend
+
+
+@pytest.mark.parametrize(
+    ["name", "expected"],
+    [
+        ("my_table", "data-project.my_dataset.my_table"),
+        ("other_dataset.my_table", "data-project.other_dataset.my_table"),
+        (
+            "other-project.other_dataset.my_table",
+            "other-project.other_dataset.my_table",
+        ),
+    ],
+)
+def test_fully_qualified_name(backend, name, expected):
+    assert backend._fully_qualified_name(name, None) == expected
+
+
+def test_fully_qualified_name_too_many_parts(backend):
+    with pytest.raises(ValueError, match="too many components"):
+        backend._fully_qualified_name("a.b.c.d", None)
+
+
+def test_schema_to_dtypes():
+    schema = ibis.schema(
+        [
+            ("fl", "float64"),
+            ("ts_tz", dt.Timestamp(timezone="UTC")),
+            ("ts", "timestamp"),
+            ("num", "int64"),
+            ("text", "string"),
+        ]
+    )
+    got = ibis_bigquery._schema_to_dtypes(schema)
+    # Only dtypes that survive NULLs are pre-applied; the rest are left to
+    # Schema.apply_to.
+    assert got == {
+        "fl": np.dtype("float64"),
+        "ts_tz": pd.DatetimeTZDtype("ns", "UTC"),
+    }